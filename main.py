@@ -6,9 +6,57 @@ Basic conversion using pypdfium2 with custom font support (devbuild)
 
 import sys
 import os
-from PIL import Image
+
+# Drop-in zlib builds with faster deflate (zlib-ng in compat mode, Cloudflare zlib)
+# Override with PDFCONV_ZLIB=/path/to/libz, or set it to an empty string to disable
+ZLIB_PATHS = [
+    "/opt/zlib-ng/lib/libz.so.1",
+    "/opt/cloudflare-zlib/lib/libz.so.1",
+]
+
+
+def _preload_fast_zlib():
+    """Re-exec the interpreter with a faster zlib preloaded for PNG deflate
+
+    The dynamic loader only honours LD_PRELOAD at process start, so it cannot
+    simply be set in os.environ once Pillow is loaded. Linux only: macOS
+    two-level namespace images would keep binding to the system zlib.
+    """
+    if not sys.platform.startswith("linux") or os.environ.get("PDFCONV_ZLIB_REEXEC"):
+        return
+    candidates = [os.environ["PDFCONV_ZLIB"]] if "PDFCONV_ZLIB" in os.environ else ZLIB_PATHS
+    zlib_path = next((path for path in candidates if path and os.path.exists(path)), None)
+    if zlib_path is None:
+        return
+    env = dict(os.environ)
+    env["LD_PRELOAD"] = os.pathsep.join(filter(None, [zlib_path, env.get("LD_PRELOAD")]))
+    # Marks the re-exec'd process, so a loader that drops LD_PRELOAD cannot cause a loop
+    env["PDFCONV_ZLIB_REEXEC"] = "1"
+    # orig_argv keeps interpreter flags such as -O, -u, -X and -W
+    os.execve(sys.executable, [sys.executable] + sys.orig_argv[1:], env)
+
+
+# Re-exec before the heavy imports below, so only the final process pays for them
+if __name__ == "__main__":
+    _preload_fast_zlib()
+
+import math
+import zlib
+import struct
+import ctypes
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pypdfium2._library_scope import initialize_with_fonts
 from pypdfium2._helpers.document import PdfDocument
+from pypdfium2._helpers.bitmap import PdfBitmap
+from pypdfium2.internal import BitmapTypeToNChannels
+import pypdfium2.raw as pdfium_c
+
+try:
+    import cv2  # Optional: encodes PNG several times faster than Pillow
+except ImportError:
+    cv2 = None
 
 
 # Initialize PDFium with custom fonts for better Chinese text rendering
@@ -21,24 +69,309 @@ FONT_PATHS = [
 initialize_with_fonts(FONT_PATHS)
 
 
+class _ReusableBitmaps:
+    """Bitmap maker for PdfPage.render() that recycles one pixel buffer
+
+    The buffer grows to the largest page rendered so far, so a batch of pages
+    does not allocate a fresh page-sized buffer per page. Each bitmap is only
+    valid until the next render, so it must be saved before then.
+    """
+
+    def __init__(self):
+        self.buffer = None
+
+    def __call__(self, width, height, format, rev_byteorder=False):
+        size = width * height * BitmapTypeToNChannels[format]
+        if self.buffer is None or len(self.buffer) < size:
+            self.buffer = (ctypes.c_ubyte * size)()
+        return PdfBitmap.new_native(width, height, format, rev_byteorder, buffer=self.buffer)
+
+
+# Pool workers render their pages one after another, so they share one buffer per process
+_worker_bitmaps = _ReusableBitmaps()
+_worker_pdf = None  # Set by _init_worker() in each pool process
+
+# File extension used for generated names, per --format; saving keys off the extension
+IMAGE_EXTENSIONS = {"png": ".png", "jpeg": ".jpg", "jpg": ".jpg"}
+JPEG_QUALITY = 90  # Preview quality; encodes far faster than PNG deflate
+
+# Without --threads, fewer pages than this are converted in-process with one encoder
+# thread per core. Starting the pool measured 20-60 ms (about one 150 DPI page
+# encode), while rendering is only ~12% of per-page time, so one rendering thread
+# keeps several encoders busy
+PROCESS_POOL_MIN_PAGES = 5
+
+# Rendered pages allowed to wait for the encoder threads in in-process --all mode
+PIPELINE_DEPTH = 2
+
+# Stop of an open-ended --pages range such as "5-"
+OPEN_PAGE_RANGE_END = sys.maxsize
+
+# Rows rendered past each edge of a --strip-rows strip, so clipping doesn't show at the seams
+STRIP_OVERLAP = 16
+
+
+def _png_chunk(tag, data):
+    """Encode one PNG chunk (length, tag, data, CRC)"""
+    return struct.pack(">I", len(data)) + tag + data + struct.pack(">I", zlib.crc32(tag + data))
+
+
+def _phys_chunk(dpi):
+    """Encode a PNG pHYs chunk recording dpi as pixels per metre"""
+    pixels_per_metre = round(dpi / 0.0254)
+    return _png_chunk(b"pHYs", struct.pack(">IIB", pixels_per_metre, pixels_per_metre, 1))
+
+
+def _save_page_strips(pdf_page, output_path, dpi, compress_level=1, strip_rows=512):
+    """Render a page in horizontal strips, streaming each into the PNG file
+
+    Peak memory is one strip rather than the whole page bitmap, which makes
+    very high DPI renders feasible. Output is always opaque 8-bit RGB.
+    PDFium clips anti-aliasing at bitmap edges, so each strip is rendered with
+    STRIP_OVERLAP extra rows on both sides that are then dropped. Pixels may
+    still differ from a full-page render by 1 level, as PDFium rounds edge
+    coverage differently once the page is offset.
+    """
+    scale = dpi / 72.0
+    width = math.ceil(pdf_page.get_width() * scale)
+    height = math.ceil(pdf_page.get_height() * scale)
+    strip_rows = min(strip_rows, height)
+    overlap = min(STRIP_OVERLAP, height - strip_rows)
+    bitmap_rows = strip_rows + 2 * overlap
+
+    # Reverse byte order gives RGB, which PNG stores as-is
+    bitmap = PdfBitmap.new_native(width, bitmap_rows, pdfium_c.FPDFBitmap_BGR, rev_byteorder=True)
+    flags = pdfium_c.FPDF_ANNOT | pdfium_c.FPDF_REVERSE_BYTE_ORDER
+    compressor = zlib.compressobj(compress_level)
+
+    with open(output_path, "wb") as f:
+        f.write(b"\x89PNG\r\n\x1a\n")
+        f.write(_png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)))
+        f.write(_phys_chunk(dpi))
+
+        for top in range(0, height, strip_rows):
+            rows = min(strip_rows, height - top)
+            # Start the overlap above the strip, kept inside the page at either end
+            render_top = min(max(top - overlap, 0), height - bitmap_rows)
+            skip = top - render_top
+            bitmap.fill_rect((255, 255, 255, 255), 0, 0, width, bitmap_rows)
+            # Shift the page up so render_top lands at the bitmap origin
+            pdfium_c.FPDF_RenderPageBitmap(bitmap, pdf_page, 0, -render_top, width, height, 0, flags)
+
+            buffer = memoryview(bitmap.buffer).cast("B")
+            scanlines = b"".join(
+                b"\x00" + buffer[row * bitmap.stride:row * bitmap.stride + width * 3]
+                for row in range(skip, skip + rows)
+            )
+            f.write(_png_chunk(b"IDAT", compressor.compress(scanlines)))
+
+        f.write(_png_chunk(b"IDAT", compressor.flush()))
+        f.write(_png_chunk(b"IEND", b""))
+
+    bitmap.close()
+    return width, height
+
+
+def _is_jpeg(path):
+    """Whether an output path asks for JPEG rather than PNG"""
+    return os.path.splitext(path)[1].lower() in (".jpg", ".jpeg")
+
+
+def _reduce_colors(image, palette):
+    """Shrink a page image to fewer bytes per pixel for PNG output
+
+    "auto" is lossless: all-gray pages become 8-bit grayscale, pages with at
+    most 256 colors become palette images, anything richer is left as-is.
+    "always" quantizes every page to 256 colors with the fast, lossy octree.
+    """
+    from PIL import Image
+
+    if palette == "always":
+        return image.quantize(colors=256, method=Image.Quantize.FASTOCTREE)
+    colors = image.getcolors(maxcolors=256)  # None once more than 256 colors are seen
+    if colors is None:
+        return image
+    if all(r == g == b for _, (r, g, b) in colors):
+        return image.convert("L")
+    # Max coverage maps each of at most 256 colors to itself, unlike the octree
+    return image.quantize(colors=256, method=Image.Quantize.MAXCOVERAGE, dither=Image.Dither.NONE)
+
+
+def _save_page(pdf_page, output_path, dpi, compress_level=1, bitmap_maker=PdfBitmap.new_native, strip_rows=None,
+               palette=None):
+    """Render a loaded page with DPI scale, save it, and return its pixel size
+
+    Writes JPEG for .jpg/.jpeg paths and PNG otherwise. compress_level is the
+    PNG zlib level (0-9); deflate dominates save time, so the fast level 1 is
+    the default at the cost of slightly larger files.
+    Uses OpenCV for full-color PNG when installed, Pillow otherwise.
+    With strip_rows, the page is rendered and encoded in strips of that height.
+    palette ("auto" or "always") reduces PNG colors first, see _reduce_colors().
+    """
+    if strip_rows:
+        if _is_jpeg(output_path) or palette:
+            raise ValueError("Strip rendering only supports full-color PNG output")
+        return _save_page_strips(pdf_page, output_path, dpi, compress_level, strip_rows)
+    return _save_bitmap(_render_bitmap(pdf_page, dpi, bitmap_maker), output_path, dpi, compress_level, palette)
+
+
+def _render_bitmap(pdf_page, dpi, bitmap_maker=PdfBitmap.new_native):
+    """Render a loaded page with DPI scale"""
+    # Render straight into the encoder's channel order: BGR for OpenCV, RGB for Pillow
+    return pdf_page.render(scale=dpi / 72.0, rotation=0, bitmap_maker=bitmap_maker, rev_byteorder=cv2 is None)
+
+
+def _save_bitmap(bitmap, output_path, dpi, compress_level=1, palette=None):
+    """Encode a rendered bitmap as PNG or JPEG and return its pixel size
+
+    Makes no PDFium calls, so it may run concurrently with rendering.
+    """
+    jpeg = _is_jpeg(output_path)
+    # OpenCV cannot write palette PNGs or a JFIF density, so those always go through Pillow
+    if cv2 is not None and not (jpeg or palette):
+        # to_numpy() is a view of the PDFium buffer, so nothing is copied before encoding
+        ok, encoded = cv2.imencode(".png", bitmap.to_numpy(), [cv2.IMWRITE_PNG_COMPRESSION, compress_level])
+        if not ok:
+            raise OSError(f"Failed to encode image: {output_path}")
+        # OpenCV writes no pHYs chunk; add one right after the signature and IHDR
+        data = encoded.tobytes()
+        with open(output_path, "wb") as f:
+            f.write(data[:33])
+            f.write(_phys_chunk(dpi))
+            f.write(data[33:])
+    else:
+        # Pillow still copies RGB into its own 4-byte layout, but no longer has to swap channels
+        image = bitmap.to_pil()
+        if jpeg:
+            image.save(output_path, "JPEG", dpi=(dpi, dpi), quality=JPEG_QUALITY, optimize=False)
+        else:
+            if palette:
+                image = _reduce_colors(image, palette)
+            image.save(output_path, dpi=(dpi, dpi), compress_level=compress_level, optimize=False)
+    return bitmap.width, bitmap.height
+
+
+def _init_worker(pdf_path):
+    """Open the document once per worker process, for all of its _render_page() tasks
+
+    PDFium handles cannot be shared across processes, so each worker needs its own.
+    """
+    global _worker_pdf
+    _worker_pdf = PdfDocument(pdf_path)
+
+
+def _render_page(page_num, dpi, out_path, compress_level=1, strip_rows=None, palette=None):
+    """Render one page of the worker's document to an image file"""
+    pdf_page = _worker_pdf[page_num]
+    try:
+        _save_page(pdf_page, out_path, dpi, compress_level, _worker_bitmaps, strip_rows, palette)
+    finally:
+        pdf_page.close()
+    return out_path
+
+
 class PDFConverter:
-    """Simple PDF to PNG converter"""
+    """Simple PDF to PNG/JPEG converter"""
 
     def __init__(self):
         self.pdf = None
+        self.pdf_path = None
+        self.pdf_name = None  # file name without extension, used for generated output names
+        self.last_size = None  # (width, height) of the last image from convert_to_image
+
+    def _convert_pages_pipelined(self, output_paths, dpi, compress_level=1, palette=None, encoders=1):
+        """Convert pages of the loaded PDF, rendering the next page while earlier ones encode
+
+        output_paths maps each page index to convert onto its output file.
+        The calling thread renders (and is the only one touching PDFium);
+        `encoders` threads save, in parallel since OpenCV, Pillow and zlib
+        release the GIL while encoding. A fixed pool of reusable buffers
+        circulates between them, which bounds memory and avoids per-page copies.
+        """
+        page_count = len(self.pdf)
+        converted_files = set()
+        ready = queue.Queue(maxsize=PIPELINE_DEPTH)
+        free = queue.Queue()
+        # One buffer per queue slot, plus one per encoder thread and one being rendered
+        for _ in range(PIPELINE_DEPTH + encoders + 1):
+            free.put((_ReusableBitmaps(), None))
+
+        def encode():
+            while True:
+                item = ready.get()
+                if item is None:
+                    return
+                page_num, output_path, bitmaps, bitmap = item
+                try:
+                    _save_bitmap(bitmap, output_path, dpi, compress_level, palette)
+                    converted_files.add(output_path)
+                    print(f"✓ Page {page_num + 1}/{page_count}: {os.path.basename(output_path)}")
+                except Exception as e:
+                    print(f"❌ Error converting page {page_num + 1} of {self.pdf_path}: {e}")
+                finally:
+                    # Hand the bitmap back so it's closed on the rendering thread
+                    free.put((bitmaps, bitmap))
+
+        def encoders_alive():
+            return any(thread.is_alive() for thread in threads)
+
+        def hand_off(item):
+            # Don't block forever on a full queue if every encoder thread died
+            while True:
+                try:
+                    return ready.put(item, timeout=1)
+                except queue.Full:
+                    if not encoders_alive():
+                        raise RuntimeError("Encoder threads stopped unexpectedly")
+
+        threads = [threading.Thread(target=encode) for _ in range(encoders)]
+        for thread in threads:
+            thread.start()
+        try:
+            for page_num, output_path in output_paths.items():
+                bitmaps, spent = free.get()
+                if spent is not None:
+                    spent.close()
+                try:
+                    pdf_page = self.pdf[page_num]
+                    bitmap = _render_bitmap(pdf_page, dpi, bitmaps)
+                    pdf_page.close()
+                except Exception as e:
+                    print(f"❌ Error converting page {page_num + 1} of {self.pdf_path}: {e}")
+                    free.put((bitmaps, None))
+                    continue
+                hand_off((page_num, output_path, bitmaps, bitmap))
+        finally:
+            # One stop marker per encoder thread
+            for _ in threads:
+                if not encoders_alive():
+                    break
+                hand_off(None)
+            for thread in threads:
+                thread.join()
+
+        while not free.empty():
+            _, spent = free.get()
+            if spent is not None:
+                spent.close()
+        # Encoders finish out of order; report files in page order
+        return [path for path in output_paths.values() if path in converted_files]
 
     def load_pdf(self, pdf_path):
         """Load PDF file"""
         if not os.path.exists(pdf_path):
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
         self.pdf = PdfDocument(pdf_path)
+        self.pdf_path = pdf_path
+        self.pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
         return len(self.pdf)
 
-    def convert_to_image(self, pdf_path, output_path=None, dpi=150, page=0):
-        """Convert PDF page to PNG image"""
+    def convert_to_image(self, pdf_path, output_path=None, dpi=150, page=0, compress_level=1, strip_rows=None,
+                         image_format="png", palette=None):
+        """Convert PDF page to image; the output extension picks PNG or JPEG"""
         try:
-            # Load PDF if not already loaded
-            if not self.pdf or (hasattr(self.pdf, 'name') and self.pdf.name != pdf_path):
+            # Load PDF once; later calls for the same file reuse the open document
+            if self.pdf_path != pdf_path:
                 page_count = self.load_pdf(pdf_path)
             else:
                 page_count = len(self.pdf)
@@ -46,122 +379,266 @@ class PDFConverter:
             if page < 0 or page >= page_count:
                 raise ValueError(f"Invalid page {page}. PDF has {page_count} pages.")
 
-            # Get page
-            pdf_page = self.pdf[page]
-
-            # Render with DPI scale
-            scale = dpi / 72.0
-            bitmap = pdf_page.render(scale=scale, rotation=0)
-
-            # Convert to PIL Image
-            image = bitmap.to_pil()
-
             # Generate output path if not provided
             if not output_path:
                 output_dir = "output"
                 os.makedirs(output_dir, exist_ok=True)
-                pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
-                output_path = os.path.join(output_dir, f"{pdf_name}_page_{page + 1}.png")
-
-            # Save image
-            image.save(output_path, dpi=(dpi, dpi))
+                ext = IMAGE_EXTENSIONS[image_format]
+                output_path = os.path.join(output_dir, f"{self.pdf_name}_page_{page + 1}{ext}")
 
+            # Render and save image
+            self.last_size = _save_page(
+                self.pdf[page], output_path, dpi, compress_level, strip_rows=strip_rows, palette=palette
+            )
             return output_path
 
         except Exception as e:
             print(f"❌ Error converting {pdf_path}: {e}")
             return None
 
-    def convert_all_pages(self, pdf_path, output_dir="output", dpi=150):
-        """Convert all PDF pages to PNG images"""
+    def convert_all_pages(self, pdf_path, output_dir="output", dpi=150, threads=None, compress_level=1,
+                          strip_rows=None, image_format="png", palette=None, pages=None):
+        """Convert all PDF pages to images in image_format ("png" or "jpeg")
+
+        pages optionally restricts conversion to the 0-based page indices in
+        the given ranges (see _parse_page_ranges()); other pages are skipped.
+
+        Pages are rendered in parallel by up to `threads` worker processes
+        (default: one per CPU core). PDFium is not thread-safe, so each worker
+        opens its own copy of the document once, when it starts. Without an
+        explicit `threads`, short documents skip the process start-up cost:
+        this process renders while one encoder thread per core saves.
+        """
         try:
             page_count = self.load_pdf(pdf_path)
             os.makedirs(output_dir, exist_ok=True)
 
-            pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
-            converted_files = []
-
-            for page_num in range(page_count):
-                output_path = os.path.join(output_dir, f"{pdf_name}_page_{page_num + 1}.png")
-                result = self.convert_to_image(pdf_path, output_path, dpi, page_num)
-                if result:
-                    converted_files.append(result)
-                    print(f"✓ Page {page_num + 1}/{page_count}: {os.path.basename(result)}")
-
-            return converted_files
+            if pages is None:
+                page_nums = range(page_count)
+            else:
+                # Check bounds on the ranges themselves, so a huge range fails before it is expanded
+                for page_range in pages:
+                    last = page_range.start + 1 if page_range.stop == OPEN_PAGE_RANGE_END else page_range.stop
+                    if last > page_count:
+                        raise ValueError(f"Invalid page {last}. PDF has {page_count} pages.")
+                page_nums = sorted({
+                    page_num
+                    for page_range in pages
+                    for page_num in range(page_range.start, min(page_range.stop, page_count))
+                })
+            if not page_nums:
+                return []
+
+            # Build every output path up front, so workers get ready-made paths
+            ext = IMAGE_EXTENSIONS[image_format]
+            output_paths = {
+                page_num: os.path.join(output_dir, f"{self.pdf_name}_page_{page_num + 1}{ext}")
+                for page_num in page_nums
+            }
+            workers = min(threads or os.cpu_count() or 1, len(output_paths))
+            in_process = workers <= 1 or (not threads and len(output_paths) < PROCESS_POOL_MIN_PAGES)
+
+            if in_process and not strip_rows:
+                return self._convert_pages_pipelined(output_paths, dpi, compress_level, palette, workers)
+
+            if in_process:
+                # Strips interleave rendering and encoding, so there is nothing to overlap
+                converted_files = []
+                bitmaps = _ReusableBitmaps()
+                for page_num, output_path in output_paths.items():
+                    try:
+                        _save_page(self.pdf[page_num], output_path, dpi, compress_level, bitmaps, strip_rows, palette)
+                    except Exception as e:
+                        print(f"❌ Error converting page {page_num + 1} of {pdf_path}: {e}")
+                        continue
+                    converted_files.append(output_path)
+                    print(f"✓ Page {page_num + 1}/{page_count}: {os.path.basename(output_path)}")
+                return converted_files
+
+            results = {}
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pdf_path,)) as executor:
+                futures = {
+                    executor.submit(
+                        _render_page, page_num, dpi, output_path, compress_level, strip_rows, palette
+                    ): page_num
+                    for page_num, output_path in output_paths.items()
+                }
+                for future in as_completed(futures):
+                    page_num = futures[future]
+                    try:
+                        results[page_num] = future.result()
+                    except Exception as e:
+                        print(f"❌ Error converting page {page_num + 1} of {pdf_path}: {e}")
+                        continue
+                    print(f"✓ Page {page_num + 1}/{page_count}: {os.path.basename(results[page_num])}")
+
+            return [results[page_num] for page_num in sorted(results)]
 
         except Exception as e:
             print(f"❌ Error converting {pdf_path}: {e}")
             return []
 
 
+def _pop_option(argv, name, default=None):
+    """Remove `name VALUE` or `name=VALUE` from argv and return VALUE (or default if absent)
+
+    Exits with an error if the option is given without a value.
+    """
+    for index, arg in enumerate(argv):
+        if arg == name:
+            argv.pop(index)
+            value = argv.pop(index) if index < len(argv) and not argv[index].startswith("--") else ""
+        elif arg.startswith(name + "="):
+            argv.pop(index)
+            value = arg[len(name) + 1:]
+        else:
+            continue
+        if not value:
+            print(f"❌ {name} needs a value")
+            sys.exit(1)
+        return value
+    return default
+
+
+def _parse_page_ranges(spec):
+    """Parse a 1-based page list like "100-110,200,300-" into 0-based ranges
+
+    An open-ended range ("300-") stops at OPEN_PAGE_RANGE_END, which
+    convert_all_pages() clamps to the last page.
+    """
+    page_ranges = []
+    for part in spec.split(","):
+        first, dash, last = part.strip().partition("-")
+        first = int(first)
+        if not dash:
+            last = first
+        elif last:
+            last = int(last)
+        else:
+            last = OPEN_PAGE_RANGE_END
+        if first < 1 or last < first:
+            raise ValueError(f"Invalid page range: {part}")
+        page_ranges.append(range(first - 1, last))
+    return page_ranges
+
+
 def main():
-    """Main function - Simple PDF to PNG conversion"""
+    """Main function - Simple PDF to PNG/JPEG conversion"""
     # Default PDF file if no arguments provided
     pdf_path = "input/page5.pdf"
-
-    if len(sys.argv) > 1:
-        if sys.argv[1] in ['-h', '--help']:
-            print("Simple PDF to PNG Converter")
-            print("Usage: python main.py [pdf_file] [output_path] [dpi] [page_number]")
+    argv = list(sys.argv)
+
+    # Options may appear anywhere; strip them before positional parsing
+    try:
+        threads = int(_pop_option(argv, '--threads', 0)) or None
+    except ValueError:
+        threads = None
+    try:
+        compress_level = min(max(int(_pop_option(argv, '--compress', 1)), 0), 9)
+    except ValueError:
+        compress_level = 1
+    try:
+        strip_rows = max(int(_pop_option(argv, '--strip-rows', 0)), 0) or None
+    except ValueError:
+        strip_rows = None
+    image_format = _pop_option(argv, '--format', 'png').lower()
+    if image_format not in IMAGE_EXTENSIONS:
+        print(f"❌ Unsupported format: {image_format} (use png or jpeg)")
+        sys.exit(1)
+    pages = _pop_option(argv, '--pages')
+    if pages is not None:
+        try:
+            pages = _parse_page_ranges(pages)
+        except ValueError:
+            print(f"❌ Invalid page list: {pages} (e.g. 1-3,7)")
+            sys.exit(1)
+    palette = _pop_option(argv, '--palette')
+    if palette not in (None, "auto", "always"):
+        print(f"❌ Unsupported palette mode: {palette} (use auto or always)")
+        sys.exit(1)
+
+    if len(argv) > 1:
+        if argv[1] in ['-h', '--help']:
+            print("Simple PDF to PNG/JPEG Converter")
+            print("Usage: python main.py [pdf_file] [output_path] [dpi] [page_number] [--threads N] [--compress 0-9]"
+                  " [--strip-rows N] [--format png|jpeg] [--palette auto|always]"
+                  " [--pages LIST]")
             print("")
             print("Examples:")
             print("  python main.py input/document.pdf")
             print("  python main.py input/document.pdf output.png 150")
             print("  python main.py input/document.pdf output.png 150 0")
             print("  python main.py input/document.pdf --all [output_dir]")
+            print("  python main.py input/document.pdf --all output --threads 4")
+            print("  python main.py input/document.pdf output.png 300 --compress 6")
+            print("  python main.py input/document.pdf output.png 1200 --strip-rows 512  # low memory")
+            print("  python main.py input/document.pdf preview.jpg 150  # JPEG, chosen by extension")
+            print("  python main.py input/document.pdf --all output --format jpeg")
+            print("  python main.py input/document.pdf --all output --palette auto  # smaller text-page PNGs")
+            print("  python main.py input/document.pdf --all output --pages=100-110,200,300-")
             print("  python main.py  # uses input/page5.pdf")
             sys.exit(0)
         else:
-            pdf_path = sys.argv[1]
+            pdf_path = argv[1]
 
-    # Parse arguments
+    # Parse positional arguments
     output_path = None
     dpi = 150
     page = 0
     convert_all = False
     output_dir = "output"
 
-    if len(sys.argv) > 2:
-        if sys.argv[2] == '--all':
+    if len(argv) > 2:
+        if argv[2] == '--all':
             convert_all = True
-            output_dir = sys.argv[3] if len(sys.argv) > 3 else "output"
+            output_dir = argv[3] if len(argv) > 3 else "output"
         else:
-            custom_output = sys.argv[2]
+            custom_output = argv[2]
             if os.path.isabs(custom_output):
                 output_path = custom_output
             else:
                 os.makedirs(output_dir, exist_ok=True)
                 output_path = os.path.join(output_dir, custom_output)
 
-            if len(sys.argv) > 3:
+            if len(argv) > 3:
                 try:
-                    dpi = int(sys.argv[3])
-                    if len(sys.argv) > 4:
-                        page = int(sys.argv[4]) - 1
+                    dpi = int(argv[3])
+                    if len(argv) > 4:
+                        page = int(argv[4]) - 1
                 except ValueError:
                     dpi = 150
 
+    if pages is not None and not convert_all:
+        print("❌ --pages only applies with --all; give the page number positionally instead")
+        sys.exit(1)
+    jpeg = _is_jpeg(output_path) if output_path else image_format != "png"
+    if strip_rows and (palette or jpeg):
+        print("❌ --strip-rows only supports full-color PNG output (no --palette or JPEG)")
+        sys.exit(1)
+
     # Initialize converter
     converter = PDFConverter()
 
     # Convert PDF
     if convert_all:
-        print(f"🖼️ Converting all pages to {output_dir}/...")
-        converted_files = converter.convert_all_pages(pdf_path, output_dir, dpi)
+        print(f"🖼️ Converting {'selected' if pages else 'all'} pages to {output_dir}/...")
+        converted_files = converter.convert_all_pages(
+            pdf_path, output_dir, dpi, threads, compress_level, strip_rows, image_format, palette, pages
+        )
         if converted_files:
             print(f"✅ Successfully converted {len(converted_files)} pages to {os.path.abspath(output_dir)}")
         else:
             print("❌ No pages were converted")
     else:
-        print(f"🖼️ Converting to PNG (DPI: {dpi})...")
-        result = converter.convert_to_image(pdf_path, output_path, dpi, page)
+        print(f"🖼️ Converting to {'JPEG' if jpeg else 'PNG'} (DPI: {dpi})...")
+        result = converter.convert_to_image(
+            pdf_path, output_path, dpi, page, compress_level, strip_rows, image_format, palette
+        )
 
         if result:
             print(f"✅ Successfully converted to {os.path.abspath(result)}")
             # Show image info
-            img = Image.open(result)
-            print(f"📐 Size: {img.size} pixels")
+            print(f"📐 Size: {converter.last_size} pixels")
             print(f"📐 DPI: {dpi}")
         else:
             print("❌ Conversion failed")
@@ -11,7 +11,7 @@ def main():
     page = pdf[0]
     bitmap = page.render(scale=2.0)  # 2x scale for good quality
     image = bitmap.to_pil()
-    image.save("output/page5_page_1.png")
+    image.save("output/page5_page_1.png", compress_level=1)  # fast deflate
 
     print("PDF page converted successfully!")
     print(f"Page rendered at {bitmap.width}x{bitmap.height} pixels")